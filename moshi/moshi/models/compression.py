@@ -422,6 +422,31 @@ class MimiModel(CompressionModel[_MimiState]):
         """Decode from the discrete codes to continuous latent space."""
         return self.quantizer.decode(codes)
 
+    def warmup(self, steps: int = 2, batch_size: int = 1) -> None:
+        """Encode and decode a few frames of silence.
+
+        This triggers the lazy `torch.compile` compilation and the CUDA graph
+        captures at the streaming chunk shape, so the first real chunk of a
+        session does not pay the compilation latency. If the model is
+        streaming, this advances the streaming state: call `reset_streaming`
+        before processing real audio.
+        """
+        param = next(self.parameters())
+        frame_size = int(self.sample_rate / self.frame_rate)
+        with torch.no_grad():
+            for _ in range(steps):
+                chunk = torch.zeros(
+                    batch_size,
+                    self.channels,
+                    frame_size,
+                    dtype=param.dtype,
+                    device=param.device,
+                )
+                codes = self.encode(chunk)
+                self.decode(codes)
+        if param.device.type == "cuda":
+            torch.cuda.synchronize()
+
 
 class WrapperCompressionModel(CompressionModel[State]):
     """Base API for CompressionModel wrappers that do not depend on external frameworks."""
@@ -183,6 +183,8 @@ class StreamingConv1d(StreamingModule[_StreamingConv1dState]):
         norm: str = "none",
         norm_kwargs: tp.Dict[str, tp.Any] = {},
         pad_mode: str = "reflect",
+        device=None,
+        dtype=None,
     ):
         super().__init__()
         # warn user on unusual setup between dilation and stride
@@ -202,6 +204,8 @@ class StreamingConv1d(StreamingModule[_StreamingConv1dState]):
             causal=causal,
             norm=norm,
             norm_kwargs=norm_kwargs,
+            device=device,
+            dtype=dtype,
         )
         self.causal = causal
         self.pad_mode = pad_mode
@@ -231,12 +235,15 @@ class StreamingConv1d(StreamingModule[_StreamingConv1dState]):
 
     def forward(self, x):
         B, C, T = x.shape
-        padding_total = self._padding_total
-        extra_padding = get_extra_padding_for_conv1d(
-            x, self._effective_kernel_size, self._stride, padding_total
-        )
         state = self._streaming_state
         if state is None:
+            # The padding layout only matters for the one-shot case: when
+            # streaming, the initial left padding is cached in the state and
+            # added once, and incomplete frames wait in the conv's buffer.
+            padding_total = self._padding_total
+            extra_padding = get_extra_padding_for_conv1d(
+                x, self._effective_kernel_size, self._stride, padding_total
+            )
             if self.causal:
                 # Left padding for causal
                 x = pad1d(x, (padding_total, extra_padding), mode=self.pad_mode)
@@ -279,6 +286,8 @@ class StreamingConvTranspose1d(StreamingModule[_StreamingConvTr1dState]):
         norm: str = "none",
         trim_right_ratio: float = 1.0,
         norm_kwargs: tp.Dict[str, tp.Any] = {},
+        device=None,
+        dtype=None,
     ):
         super().__init__()
         self.convtr = NormConvTranspose1d(
@@ -291,6 +300,8 @@ class StreamingConvTranspose1d(StreamingModule[_StreamingConvTr1dState]):
             causal=causal,
             norm=norm,
             norm_kwargs=norm_kwargs,
+            device=device,
+            dtype=dtype,
         )
         self.causal = causal
         self.trim_right_ratio = trim_right_ratio
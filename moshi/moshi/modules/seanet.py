@@ -8,9 +8,9 @@
 # This source code is licensed under the license found in the
 # LICENSE file in the root directory of this source tree.
 
+import math
 import typing as tp
 
-import numpy as np
 import torch.nn as nn
 
 from .conv import StreamingConv1d, StreamingConvTranspose1d
@@ -18,6 +18,24 @@ from .streaming import StreamingContainer, StreamingAdd
 from ..utils.compile import torch_compile_lazy
 
 
+# Activation classes resolved once at import time, so that every residual
+# block construction doesn't go through a `getattr` on the `nn` namespace.
+_ACTIVATIONS: tp.Dict[str, tp.Type[nn.Module]] = {
+    "ELU": nn.ELU,
+    "GELU": nn.GELU,
+    "ReLU": nn.ReLU,
+    "Tanh": nn.Tanh,
+}
+
+
+def _get_activation(name: str) -> tp.Type[nn.Module]:
+    """Resolve an activation class by name, e.g. "ELU" -> `nn.ELU`."""
+    try:
+        return _ACTIVATIONS[name]
+    except KeyError:
+        return getattr(nn, name)
+
+
 class SEANetResnetBlock(StreamingContainer):
     """Residual block from SEANet model.
 
@@ -34,6 +52,8 @@ class SEANetResnetBlock(StreamingContainer):
         compress (int): Reduced dimensionality in residual branches (from Demucs v3).
         true_skip (bool): Whether to use true skip connection or a simple
             (streamable) convolution as the skip connection.
+        device (torch.device, optional): Device on which to initialize the module.
+        dtype (torch.dtype, optional): dtype to use to initialize the module.
     """
 
     def __init__(
@@ -49,12 +69,14 @@ class SEANetResnetBlock(StreamingContainer):
         pad_mode: str = "reflect",
         compress: int = 2,
         true_skip: bool = True,
+        device=None,
+        dtype=None,
     ):
         super().__init__()
         assert len(kernel_sizes) == len(
             dilations
         ), "Number of kernel sizes should match number of dilations"
-        act = getattr(nn, activation)
+        act = _get_activation(activation)
         hidden = dim // compress
         block = []
         for i, (kernel_size, dilation) in enumerate(zip(kernel_sizes, dilations)):
@@ -71,10 +93,13 @@ class SEANetResnetBlock(StreamingContainer):
                     norm_kwargs=norm_params,
                     causal=causal,
                     pad_mode=pad_mode,
+                    device=device,
+                    dtype=dtype,
                 ),
             ]
         self.block = nn.Sequential(*block)
         self.add = StreamingAdd()
+        self.true_skip = true_skip
         self.shortcut: nn.Module
         if true_skip:
             self.shortcut = nn.Identity()
@@ -87,9 +112,16 @@ class SEANetResnetBlock(StreamingContainer):
                 norm_kwargs=norm_params,
                 causal=causal,
                 pad_mode=pad_mode,
+                device=device,
+                dtype=dtype,
             )
 
     def forward(self, x):
+        if self.true_skip and not self.add.is_streaming:
+            # The shortcut is the identity and both branches have the same
+            # length, so we can skip the Identity and StreamingAdd module
+            # calls and let the residual add fuse with the block output.
+            return x + self.block(x)
         u, v = self.shortcut(x), self.block(x)
         return self.add(u, v)
 
@@ -123,6 +155,14 @@ class SEANetEncoder(StreamingContainer):
         mask_fn (nn.Module): Optional mask function to apply after convolution layers.
         mask_position (int): Position of the mask function, with mask_position == 0 for the first convolution layer,
             mask_position == 1 for the first conv block, etc.
+        internal_activation (str, optional): Activation used inside the residual blocks,
+            defaulting to `activation`. Allows e.g. swapping ELU for the cheaper ReLU in
+            the residual branches while keeping the outer activations untouched.
+        internal_activation_params (dict, optional): Parameters to provide to the residual
+            block activation. Defaults to `activation_params` when `internal_activation`
+            is unset, and to `{}` when it is set.
+        device (torch.device, optional): Device on which to initialize the module.
+        dtype (torch.dtype, optional): dtype to use to initialize the module.
     """
 
     def __init__(
@@ -147,15 +187,19 @@ class SEANetEncoder(StreamingContainer):
         disable_norm_outer_blocks: int = 0,
         mask_fn: tp.Optional[nn.Module] = None,
         mask_position: tp.Optional[int] = None,
+        internal_activation: tp.Optional[str] = None,
+        internal_activation_params: tp.Optional[dict] = None,
+        device=None,
+        dtype=None,
     ):
         super().__init__()
         self.channels = channels
         self.dimension = dimension
         self.n_filters = n_filters
-        self.ratios = list(reversed(ratios))
-        del ratios
+        # Stored as an immutable tuple, in the downsampling order.
+        self.ratios = tuple(reversed(ratios))
         self.n_residual_layers = n_residual_layers
-        self.hop_length = int(np.prod(self.ratios))
+        self.hop_length = math.prod(self.ratios)
         self.n_blocks = len(self.ratios) + 2  # first and last conv + residual blocks
         self.disable_norm_outer_blocks = disable_norm_outer_blocks
         assert (
@@ -165,7 +209,16 @@ class SEANetEncoder(StreamingContainer):
             "It should be lower or equal to the actual number of blocks in the network and greater or equal to 0."
         )
 
-        act = getattr(nn, activation)
+        act = _get_activation(activation)
+        block_activation = internal_activation or activation
+        if internal_activation_params is not None:
+            block_activation_params = internal_activation_params
+        elif internal_activation is None:
+            block_activation_params = activation_params
+        else:
+            # An overridden block activation doesn't necessarily accept the
+            # parameters of the outer one (e.g. ReLU vs ELU's alpha).
+            block_activation_params = {}
         mult = 1
         model: tp.List[nn.Module] = [
             StreamingConv1d(
@@ -176,28 +229,40 @@ class SEANetEncoder(StreamingContainer):
                 norm_kwargs=norm_params,
                 causal=causal,
                 pad_mode=pad_mode,
+                device=device,
+                dtype=dtype,
             )
         ]
         if mask_fn is not None and mask_position == 0:
             model += [mask_fn]
+        # Norm used by each downsampling stage, resolved once.
+        block_norms = [
+            "none" if self.disable_norm_outer_blocks >= i + 2 else norm
+            for i in range(len(self.ratios))
+        ]
+        # Dilation of the j-th residual layer of a stage, computed once.
+        dilations = [dilation_base**j for j in range(n_residual_layers)]
         # Downsample to raw audio scale
         for i, ratio in enumerate(self.ratios):
-            block_norm = "none" if self.disable_norm_outer_blocks >= i + 2 else norm
+            block_norm = block_norms[i]
+            ch = mult * n_filters
             # Add residual layers
             for j in range(n_residual_layers):
                 model += [
                     SEANetResnetBlock(
-                        mult * n_filters,
+                        ch,
                         kernel_sizes=[residual_kernel_size, 1],
-                        dilations=[dilation_base**j, 1],
+                        dilations=[dilations[j], 1],
                         norm=block_norm,
                         norm_params=norm_params,
-                        activation=activation,
-                        activation_params=activation_params,
+                        activation=block_activation,
+                        activation_params=block_activation_params,
                         causal=causal,
                         pad_mode=pad_mode,
                         compress=compress,
                         true_skip=true_skip,
+                        device=device,
+                        dtype=dtype,
                     )
                 ]
 
@@ -205,14 +270,16 @@ class SEANetEncoder(StreamingContainer):
             model += [
                 act(**activation_params),
                 StreamingConv1d(
-                    mult * n_filters,
-                    mult * n_filters * 2,
+                    ch,
+                    ch * 2,
                     kernel_size=ratio * 2,
                     stride=ratio,
                     norm=block_norm,
                     norm_kwargs=norm_params,
                     causal=causal,
                     pad_mode=pad_mode,
+                    device=device,
+                    dtype=dtype,
                 ),
             ]
             mult *= 2
@@ -231,14 +298,24 @@ class SEANetEncoder(StreamingContainer):
                 norm_kwargs=norm_params,
                 causal=causal,
                 pad_mode=pad_mode,
+                device=device,
+                dtype=dtype,
             ),
         ]
 
         self.model = nn.Sequential(*model)
+        # Flat view of the layers, resolved once. `self.model` remains the
+        # registered container, keeping parameter names and checkpoints
+        # unchanged.
+        self._layers = model
 
     @torch_compile_lazy
     def forward(self, x):
-        return self.model(x)
+        # Walk the pre-resolved layer list rather than going through
+        # `nn.Sequential`, saving one module dispatch per layer.
+        for layer in self._layers:
+            x = layer(x)
+        return x
 
 
 class SEANetDecoder(StreamingContainer):
@@ -269,6 +346,14 @@ class SEANetDecoder(StreamingContainer):
             For the decoder, it corresponds to the N last blocks.
         trim_right_ratio (float): Ratio for trimming at the right of the transposed convolution under the causal setup.
             If equal to 1.0, it means that all the trimming is done at the right.
+        internal_activation (str, optional): Activation used inside the residual blocks,
+            defaulting to `activation`. Allows e.g. swapping ELU for the cheaper ReLU in
+            the residual branches while keeping the outer activations untouched.
+        internal_activation_params (dict, optional): Parameters to provide to the residual
+            block activation. Defaults to `activation_params` when `internal_activation`
+            is unset, and to `{}` when it is set.
+        device (torch.device, optional): Device on which to initialize the module.
+        dtype (torch.dtype, optional): dtype to use to initialize the module.
     """
 
     def __init__(
@@ -294,15 +379,18 @@ class SEANetDecoder(StreamingContainer):
         compress: int = 2,
         disable_norm_outer_blocks: int = 0,
         trim_right_ratio: float = 1.0,
+        internal_activation: tp.Optional[str] = None,
+        internal_activation_params: tp.Optional[dict] = None,
+        device=None,
+        dtype=None,
     ):
         super().__init__()
         self.dimension = dimension
         self.channels = channels
         self.n_filters = n_filters
-        self.ratios = ratios
-        del ratios
+        self.ratios = tuple(ratios)
         self.n_residual_layers = n_residual_layers
-        self.hop_length = int(np.prod(self.ratios))
+        self.hop_length = math.prod(self.ratios)
         self.n_blocks = len(self.ratios) + 2  # first and last conv + residual blocks
         self.disable_norm_outer_blocks = disable_norm_outer_blocks
         assert (
@@ -312,7 +400,16 @@ class SEANetDecoder(StreamingContainer):
             "It should be lower or equal to the actual number of blocks in the network and greater or equal to 0."
         )
 
-        act = getattr(nn, activation)
+        act = _get_activation(activation)
+        block_activation = internal_activation or activation
+        if internal_activation_params is not None:
+            block_activation_params = internal_activation_params
+        elif internal_activation is None:
+            block_activation_params = activation_params
+        else:
+            # An overridden block activation doesn't necessarily accept the
+            # parameters of the outer one (e.g. ReLU vs ELU's alpha).
+            block_activation_params = {}
         mult = int(2 ** len(self.ratios))
         model: tp.List[nn.Module] = [
             StreamingConv1d(
@@ -325,45 +422,55 @@ class SEANetDecoder(StreamingContainer):
                 norm_kwargs=norm_params,
                 causal=causal,
                 pad_mode=pad_mode,
+                device=device,
+                dtype=dtype,
             )
         ]
 
+        # Norm used by each upsampling stage, resolved once.
+        block_norms = [
+            "none" if self.disable_norm_outer_blocks >= self.n_blocks - (i + 1) else norm
+            for i in range(len(self.ratios))
+        ]
+        # Dilation of the j-th residual layer of a stage, computed once.
+        dilations = [dilation_base**j for j in range(n_residual_layers)]
         # Upsample to raw audio scale
         for i, ratio in enumerate(self.ratios):
-            block_norm = (
-                "none"
-                if self.disable_norm_outer_blocks >= self.n_blocks - (i + 1)
-                else norm
-            )
+            block_norm = block_norms[i]
+            ch = mult * n_filters
             # Add upsampling layers
             model += [
                 act(**activation_params),
                 StreamingConvTranspose1d(
-                    mult * n_filters,
-                    mult * n_filters // 2,
+                    ch,
+                    ch // 2,
                     kernel_size=ratio * 2,
                     stride=ratio,
                     norm=block_norm,
                     norm_kwargs=norm_params,
                     causal=causal,
                     trim_right_ratio=trim_right_ratio,
+                    device=device,
+                    dtype=dtype,
                 ),
             ]
             # Add residual layers
             for j in range(n_residual_layers):
                 model += [
                     SEANetResnetBlock(
-                        mult * n_filters // 2,
+                        ch // 2,
                         kernel_sizes=[residual_kernel_size, 1],
-                        dilations=[dilation_base**j, 1],
-                        activation=activation,
-                        activation_params=activation_params,
+                        dilations=[dilations[j], 1],
+                        activation=block_activation,
+                        activation_params=block_activation_params,
                         norm=block_norm,
                         norm_params=norm_params,
                         causal=causal,
                         pad_mode=pad_mode,
                         compress=compress,
                         true_skip=true_skip,
+                        device=device,
+                        dtype=dtype,
                     )
                 ]
 
@@ -380,16 +487,21 @@ class SEANetDecoder(StreamingContainer):
                 norm_kwargs=norm_params,
                 causal=causal,
                 pad_mode=pad_mode,
+                device=device,
+                dtype=dtype,
             ),
         ]
         # Add optional final activation to decoder (eg. tanh)
         if final_activation is not None:
-            final_act = getattr(nn, final_activation)
+            final_act = _get_activation(final_activation)
             final_activation_params = final_activation_params or {}
             model += [final_act(**final_activation_params)]
         self.model = nn.Sequential(*model)
+        # Flat view of the layers, see `SEANetEncoder`.
+        self._layers = model
 
     @torch_compile_lazy
     def forward(self, z):
-        y = self.model(z)
-        return y
+        for layer in self._layers:
+            z = layer(z)
+        return z
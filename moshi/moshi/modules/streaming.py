@@ -175,6 +175,15 @@ class _StreamingAddState:
 
 
 class StreamingAdd(StreamingModule[_StreamingAddState]):
+    """Addition of two streams, aligning their lengths.
+
+    In streaming mode the two operands can be out of sync by up to the
+    convolution context (e.g. the residual branch of a SEANet block lags its
+    skip connection), so this buffers the overhanging samples of the longer
+    operand until the other side catches up. Outside of streaming mode this
+    is a plain `x + y`.
+    """
+
     def _init_streaming_state(self, batch_size: int) -> _StreamingAddState:
         return _StreamingAddState()
 